@@ -2,6 +2,10 @@ import io
 import json
 import tempfile
 import os
+import re
+import time
+import uuid
+from collections import OrderedDict
 from PIL import Image
 import numpy as np
 
@@ -27,6 +31,14 @@ MODELS_DIR = os.path.join(BASE_DIR, 'models')
 PYTHON_BACKEND_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(BASE_DIR)))), 'python_backend')
 PYTHON_BACKEND_MODEL_DIR = os.path.join(PYTHON_BACKEND_DIR, '@model')
 
+# Edit sessions keep decoded images between invocations of a warm function
+SESSION_DIR = os.path.join(tempfile.gettempdir(), 'fastutils-sessions')
+SESSION_MEMORY_LIMIT = 256 * 1024 * 1024  # Decoded pixel bytes kept in memory
+SESSION_DISK_LIMIT = 512 * 1024 * 1024  # Encoded bytes kept on disk
+SESSION_STALE_TEMP_AGE = 3600  # Seconds before an unfinished session write is removed
+SESSION_MIN_LEVEL_SIZE = 256  # Smallest pyramid level, in pixels on the longest side
+SESSION_CACHE = OrderedDict()
+
 def find_model_file(filename):
     """Find a model file in various possible locations"""
     # Check in the models directory first
@@ -49,6 +61,13 @@ def find_model_file(filename):
     
     return None
 
+def part_field_name(part):
+    """Read the name parameter from a part's Content-Disposition header"""
+    # Only look at the headers, and skip the filename="..." parameter
+    headers = part[:part.find("\r\n\r\n")]
+    match = re.search(r'(?:^|[;\s])name="([^"]*)"', headers)
+    return match.group(1) if match else None
+
 def parse_multipart(content_type, body):
     """Parse multipart form data to extract file and fields"""
     if not content_type.startswith("multipart/form-data"):
@@ -67,13 +86,15 @@ def parse_multipart(content_type, body):
         # Check if this part contains a file
         if "filename" in part and ("image/jpeg" in part or "image/png" in part):
             binary_start = part.find("\r\n\r\n") + 4
-            image_data = part[binary_start:].strip().encode()
+            # A previously returned mask is uploaded as a second file named "mask"
+            if part_field_name(part) == "mask":
+                fields["mask"] = part[binary_start:].strip().encode()
+            else:
+                image_data = part[binary_start:].strip().encode()
         
         # Extract form fields
         elif "name=" in part:
-            name_start = part.find('name="') + 6
-            name_end = part.find('"', name_start)
-            field_name = part[name_start:name_end]
+            field_name = part_field_name(part)
             
             value_start = part.find("\r\n\r\n") + 4
             field_value = part[value_start:].strip()
@@ -82,8 +103,8 @@ def parse_multipart(content_type, body):
     
     return image_data, fields
 
-def remove_background(image):
-    """Remove background from image"""
+def remove_background(image, only_mask=False, alpha_matting=False, matting_settings=None):
+    """Remove background from image, or return only the alpha matte"""
     try:
         from rembg import remove
         
@@ -97,11 +118,89 @@ def remove_background(image):
         else:
             print("Warning: u2net.pth model file not found")
         
-        return remove(image)
+        options = {"alpha_matting": alpha_matting}
+        if alpha_matting and matting_settings:
+            options.update(matting_settings)
+        
+        if only_mask and not alpha_matting:
+            # rembg can skip building the cutout when only the mask is needed
+            return remove(image, only_mask=True)
+        
+        output = remove(image, **options)
+        if only_mask:
+            # Alpha matting only refines the cutout, so take the matte from its alpha
+            return output.getchannel('A')
+        return output
     except Exception as e:
         print(f"Error removing background: {str(e)}")
         raise e
 
+def encode_mask_rle(mask):
+    """Run-length encode a mask as alternating background/foreground runs"""
+    flat = (np.array(mask.convert('L')) >= 128).ravel()
+    # Runs always start with background, so a leading foreground run gets a 0 count
+    changes = np.flatnonzero(flat[1:] != flat[:-1]) + 1
+    counts = np.diff(np.concatenate(([0], changes, [flat.size]))).tolist()
+    if flat.size and flat[0]:
+        counts.insert(0, 0)
+    return {
+        "width": mask.size[0],
+        "height": mask.size[1],
+        "counts": counts
+    }
+
+def decode_mask(mask_data):
+    """Load a mask returned by a previous call as an 8-bit grayscale image"""
+    if isinstance(mask_data, bytes):
+        return Image.open(io.BytesIO(mask_data)).convert('L')
+    
+    rle = json.loads(mask_data)
+    if not isinstance(rle, dict) or not isinstance(rle.get("counts"), list):
+        raise ValueError("Mask must be an object with width, height and counts")
+    width, height = int(rle["width"]), int(rle["height"])
+    if width <= 0 or height <= 0:
+        raise ValueError("Mask width and height must be positive")
+    # Apply the same decompression bomb limit PIL uses for uploaded images
+    if Image.MAX_IMAGE_PIXELS and width * height > Image.MAX_IMAGE_PIXELS:
+        raise ValueError("Mask is too large")
+    if not all(isinstance(c, int) and c >= 0 for c in rle["counts"]):
+        raise ValueError("Mask counts must be non-negative integers")
+    counts = np.array(rle["counts"], dtype=np.int64)
+    if counts.sum() != width * height:
+        raise ValueError("Mask run lengths do not match mask size")
+    values = (np.arange(len(counts)) % 2 * 255).astype(np.uint8)
+    return Image.fromarray(np.repeat(values, counts).reshape(height, width), 'L')
+
+def fit_mask(mask, size):
+    """Resize a mask to the given image resolution if needed"""
+    if mask.size != size:
+        mask = mask.resize(size, Image.BILINEAR)
+    return mask
+
+def apply_mask(image, mask, alpha_matting=False, matting_settings=None):
+    """Apply a mask to an image, resizing it to the image resolution if needed"""
+    mask = fit_mask(mask, image.size)
+    if alpha_matting:
+        try:
+            from rembg.bg import alpha_matting_cutout
+            
+            # Same defaults as rembg.remove
+            settings = matting_settings or {}
+            return alpha_matting_cutout(
+                image,
+                mask,
+                settings.get('alpha_matting_foreground_threshold', 240),
+                settings.get('alpha_matting_background_threshold', 10),
+                settings.get('alpha_matting_erode_size', 10)
+            )
+        except Exception as e:
+            print(f"Error applying alpha matting: {str(e)}")
+            raise e
+    
+    output = image.convert('RGBA')
+    output.putalpha(mask)
+    return output
+
 def upscale_image(image, scale_factor):
     """Upscale image using ESRGAN"""
     try:
@@ -138,26 +237,128 @@ def upscale_image(image, scale_factor):
         print(f"Error upscaling image: {str(e)}")
         raise e
 
-def compress_image(image, quality, estimate=False):
+def compression_stats(original_size, compressed_size):
+    """Build the size comparison fields returned by compression estimates"""
+    return {
+        "originalSize": original_size,
+        "compressedSize": compressed_size,
+        "compressionRatio": round(original_size / compressed_size, 2) if compressed_size > 0 else 0,
+        "savings": round((original_size - compressed_size) / original_size * 100, 2) if original_size > 0 else 0
+    }
+
+def prepare_jpeg_source(image):
+    """Convert image once into the color space the JPEG encoder works in"""
+    # Grayscale is encoded as a single channel, everything else as YCbCr.
+    # Handing the encoder YCbCr data skips its own RGB conversion on every save.
+    if image.mode in ('L', 'YCbCr'):
+        return image
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    return image.convert('YCbCr')
+
+def jpeg_size(image, quality):
+    """Return the encoded JPEG size in bytes for the given quality"""
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=quality, optimize=True)
+    return len(buffer.getvalue())
+
+def sample_bands(image, sample, groups=8, band_height=16):
+    """Split strided full-width bands covering `sample` of the image into interleaved groups"""
+    width, height = image.size
+    # Every group needs at least two bands, and all groups the same number of bands
+    bands = max(groups * 2, round(sample * height / band_height)) // groups * groups
+    if bands * band_height >= height:
+        return None
+
+    # Spread bands over the whole height, aligned to the 16px MCU grid
+    tops = []
+    for i in range(bands):
+        top = (int((i + 0.5) * height / bands) - band_height // 2) // 16 * 16
+        tops.append(min(max(0, top), height - band_height))
+
+    # Each group takes every `groups`-th band, so each one is a systematic
+    # sample of the whole image and the groups can be compared with each other
+    stitched = []
+    for group in range(groups):
+        group_tops = tops[group::groups]
+        group_image = Image.new(image.mode, (width, band_height * len(group_tops)))
+        for i, top in enumerate(group_tops):
+            group_image.paste(image.crop((0, top, width, top + band_height)), (0, i * band_height))
+        stitched.append(group_image)
+    return stitched
+
+def compress_curve(image, qualities, original_size, sample=None):
+    """Estimate compressed sizes for several qualities from a single decode"""
+    try:
+        source = prepare_jpeg_source(image)
+        width, height = source.size
+
+        groups = None
+        if sample is not None and 0 < sample < 1:
+            groups = sample_bands(source, sample)
+
+        curve = []
+        for quality in qualities:
+            if groups is None:
+                # Exact size from encoding the full image
+                compressed_size = jpeg_size(source, quality)
+                low = high = compressed_size
+            else:
+                # Header and table overhead does not grow with area, so measure it
+                # on a single MCU and only scale the entropy-coded data
+                overhead = jpeg_size(groups[0].crop((0, 0, 16, 16)), quality)
+                estimates = []
+                for group_image in groups:
+                    scale = height / group_image.size[1]
+                    data_size = max(0, jpeg_size(group_image, quality) - overhead)
+                    estimates.append(data_size * scale + overhead)
+
+                # Report the estimate with a ~95% interval from the variance across groups
+                mean = sum(estimates) / len(estimates)
+                variance = sum((e - mean) ** 2 for e in estimates) / (len(estimates) - 1)
+                margin = 2 * (variance / len(estimates)) ** 0.5
+                # Band seams add a small bias the variance cannot see, so keep a 2% floor
+                margin = max(margin, 0.02 * mean)
+                compressed_size = int(mean)
+                low = max(0, int(mean - margin))
+                high = int(mean + margin)
+
+            point = {"quality": quality}
+            point.update(compression_stats(original_size, compressed_size))
+            # Exact encodes have no uncertainty, so low and high equal the size
+            point["compressedSizeLow"] = low
+            point["compressedSizeHigh"] = high
+            curve.append(point)
+
+        sampled_area = sum(g.size[0] * g.size[1] for g in groups) if groups else width * height
+        return {
+            "originalSize": original_size,
+            "width": width,
+            "height": height,
+            "sampled": groups is not None,
+            "sampleFraction": round(sampled_area / (width * height), 4),
+            "curve": curve
+        }
+    except Exception as e:
+        print(f"Error estimating compression curve: {str(e)}")
+        raise e
+
+def compress_image(image, quality, estimate=False, original_size=None):
     """Compress image with specified quality"""
     try:
-        # Create a buffer for the original image
-        original_buffer = io.BytesIO()
-        image.save(original_buffer, format='PNG')
-        original_size = len(original_buffer.getvalue())
+        if estimate and original_size is None:
+            # Fall back to a PNG re-encode when the uploaded bytes are not available
+            original_buffer = io.BytesIO()
+            image.save(original_buffer, format='PNG')
+            original_size = len(original_buffer.getvalue())
         
         # Create a buffer for the compressed image
         compressed_buffer = io.BytesIO()
-        image.save(compressed_buffer, format='JPEG', quality=quality, optimize=True)
+        prepare_jpeg_source(image).save(compressed_buffer, format='JPEG', quality=quality, optimize=True)
         compressed_size = len(compressed_buffer.getvalue())
         
         if estimate:
-            return {
-                "originalSize": original_size,
-                "compressedSize": compressed_size,
-                "compressionRatio": round(original_size / compressed_size, 2) if compressed_size > 0 else 0,
-                "savings": round((original_size - compressed_size) / original_size * 100, 2)
-            }
+            return compression_stats(original_size, compressed_size)
         else:
             compressed_buffer.seek(0)
             return Image.open(compressed_buffer)
@@ -165,7 +366,155 @@ def compress_image(image, quality, estimate=False):
         print(f"Error compressing image: {str(e)}")
         raise e
 
-def edit_image(image, settings):
+def build_pyramid(image):
+    """Build a list of images, each half the size of the previous one"""
+    levels = [image]
+    while max(levels[-1].size) // 2 >= SESSION_MIN_LEVEL_SIZE:
+        levels.append(levels[-1].reduce(2))
+    return levels
+
+def session_path(token, level):
+    """Return the disk path for one pyramid level of a session"""
+    return os.path.join(SESSION_DIR, f"{token}_{level}.png")
+
+def image_bytes(image):
+    """Return the decoded size of an image in bytes"""
+    return image.size[0] * image.size[1] * len(image.getbands())
+
+def cache_level(token, level, image):
+    """Keep a pyramid level in memory, evicting the least recently used levels"""
+    key = (token, level)
+    SESSION_CACHE[key] = image
+    SESSION_CACHE.move_to_end(key)
+    
+    # The level just stored is kept even if it alone exceeds the limit
+    total = sum(image_bytes(cached) for cached in SESSION_CACHE.values())
+    for cached_key in list(SESSION_CACHE):
+        if total <= SESSION_MEMORY_LIMIT:
+            break
+        if cached_key != key:
+            total -= image_bytes(SESSION_CACHE.pop(cached_key))
+
+def evict_session_files(keep):
+    """Drop the least recently used sessions until the disk cache fits its limit"""
+    sessions = {}
+    now = time.time()
+    for name in os.listdir(SESSION_DIR):
+        path = os.path.join(SESSION_DIR, name)
+        try:
+            stat = os.stat(path)
+            if name.endswith('.tmp'):
+                # Left behind by an interrupted write
+                if now - stat.st_mtime > SESSION_STALE_TEMP_AGE:
+                    os.remove(path)
+                continue
+        except FileNotFoundError:
+            # Removed by another invocation since the listing
+            continue
+        
+        token = name.split('_')[0]
+        mtime, size, paths = sessions.get(token, (0, 0, []))
+        sessions[token] = (max(mtime, stat.st_mtime), size + stat.st_size, paths + [path])
+    
+    total = sum(size for _, size, _ in sessions.values())
+    for token, (_, size, paths) in sorted(sessions.items(), key=lambda item: item[1][0]):
+        if total <= SESSION_DISK_LIMIT:
+            break
+        if token == keep:
+            continue
+        # Evict whole sessions so no session is left with missing levels
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        for level in range(len(paths)):
+            SESSION_CACHE.pop((token, level), None)
+        total -= size
+
+def create_session(image):
+    """Store a decoded image and its pyramid, returning the session token"""
+    try:
+        # Normalize the mode so every pyramid level can be reduced and edited
+        if image.mode not in ['RGB', 'RGBA', 'L']:
+            image = image.convert('RGBA' if 'A' in image.mode or 'transparency' in image.info else 'RGB')
+        image.load()
+        
+        token = uuid.uuid4().hex
+        levels = build_pyramid(image)
+        
+        # Persist every level so previews never need the full image after eviction.
+        # Each file is written under a temporary name and moved into place, so a
+        # concurrent load never sees a half-written level.
+        os.makedirs(SESSION_DIR, exist_ok=True)
+        for level, level_image in enumerate(levels):
+            fd, temp_path = tempfile.mkstemp(dir=SESSION_DIR, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as temp_file:
+                level_image.save(temp_file, format='PNG', compress_level=1)
+            os.replace(temp_path, session_path(token, level))
+        
+        # Store the full image first so the preview levels are the last to be evicted
+        for level, level_image in enumerate(levels):
+            cache_level(token, level, level_image)
+        
+        evict_session_files(keep=token)
+        
+        return token
+    except Exception as e:
+        print(f"Error creating session: {str(e)}")
+        raise e
+
+def session_level_sizes(token):
+    """Return the size of each pyramid level of a session, or None if it has expired"""
+    if not re.fullmatch(r'[0-9a-f]{32}', token):
+        return None
+    
+    sizes = []
+    while True:
+        key = (token, len(sizes))
+        if key in SESSION_CACHE:
+            sizes.append(SESSION_CACHE[key].size)
+            continue
+        try:
+            # Opening only reads the PNG header, the pixels stay on disk
+            with Image.open(session_path(token, len(sizes))) as level_image:
+                sizes.append(level_image.size)
+        except OSError:
+            break
+    return sizes or None
+
+def load_session_level(token, level):
+    """Return one pyramid level of a session, or None if it has expired"""
+    key = (token, level)
+    path = session_path(token, level)
+    if key in SESSION_CACHE:
+        SESSION_CACHE.move_to_end(key)
+        level_image = SESSION_CACHE[key]
+    else:
+        try:
+            level_image = Image.open(path)
+            level_image.load()
+        except OSError:
+            # Missing, evicted or unreadable files count as an expired session
+            return None
+        cache_level(token, level, level_image)
+    
+    # Mark the session as recently used for disk eviction
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        # Already evicted from disk, the copy in memory is still usable
+        pass
+    return level_image
+
+def pyramid_level(sizes, preview_size):
+    """Pick the smallest pyramid level that still covers the preview size"""
+    for level in reversed(range(len(sizes))):
+        if max(sizes[level]) >= preview_size:
+            return level
+    return 0
+
+def edit_image(image, settings, scale=1.0):
     """Apply edits to image based on settings"""
     try:
         from PIL import ImageEnhance, ImageFilter
@@ -185,9 +534,9 @@ def edit_image(image, settings):
             factor = float(settings['saturation']) / 100
             image = ImageEnhance.Color(image).enhance(factor)
         
-        # Apply blur
+        # Apply blur, scaled so previews on smaller images look the same
         if 'blur' in settings:
-            radius = float(settings['blur'])
+            radius = float(settings['blur']) * scale
             if radius > 0:
                 image = image.filter(ImageFilter.GaussianBlur(radius=radius))
         
@@ -258,17 +607,68 @@ def main(req, res):
         content_type = req.headers.get("content-type", "")
         image_data, fields = parse_multipart(content_type, req.payload)
         
-        if not image_data:
+        # Edits on an existing session only send the token and settings
+        session_token = fields.get('session', '')
+        use_session = operation == 'edit' and session_token not in ['', 'new']
+        
+        if not image_data and not use_session:
             return res.json({"error": "No image found in request"}, 400)
         
         # Open the image
-        input_image = Image.open(io.BytesIO(image_data))
+        input_image = Image.open(io.BytesIO(image_data)) if image_data else None
+        headers = {}
+        save_options = {}
         
         # Process based on operation
         if operation == 'remove-background':
-            output_image = remove_background(input_image)
+            output = fields.get('output', 'image')
+            mask_format = fields.get('mask_format', 'png')
+            if output not in ['image', 'mask']:
+                return res.json({"error": f"Unknown output: {output}"}, 400)
+            if mask_format not in ['png', '1bit', 'rle']:
+                return res.json({"error": f"Unknown mask format: {mask_format}"}, 400)
+            
+            try:
+                alpha_matting = fields.get('alpha_matting', 'false').lower() in ['1', 'true', 'yes', 'on']
+                matting_settings = {}
+                for key in ['foreground_threshold', 'background_threshold', 'erode_size']:
+                    if key in fields:
+                        matting_settings[f"alpha_matting_{key}"] = int(fields[key])
+                
+                if 'mask' in fields:
+                    # Reuse a previously returned mask instead of re-running U2Net
+                    mask = decode_mask(fields['mask'])
+                else:
+                    mask = None
+            except (ValueError, KeyError, TypeError, OSError) as e:
+                # OSError covers corrupt or unrecognized mask images
+                return res.json({"error": f"Invalid background removal settings: {str(e)}"}, 400)
+            
+            if output == 'mask':
+                if mask is None:
+                    mask = remove_background(input_image, only_mask=True,
+                                             alpha_matting=alpha_matting, matting_settings=matting_settings)
+                elif alpha_matting:
+                    # Refine the supplied mask and return the resulting matte
+                    mask = apply_mask(input_image, mask, alpha_matting, matting_settings).getchannel('A')
+                else:
+                    mask = fit_mask(mask, input_image.size)
+                
+                if mask_format == 'rle':
+                    return res.json(encode_mask_rle(mask))
+                elif mask_format == '1bit':
+                    output_image = mask.point(lambda v: 255 if v >= 128 else 0, '1')
+                else:
+                    output_image = mask
+                filename = "mask.png"
+            else:
+                if mask is None:
+                    output_image = remove_background(input_image, alpha_matting=alpha_matting,
+                                                     matting_settings=matting_settings)
+                else:
+                    output_image = apply_mask(input_image, mask, alpha_matting, matting_settings)
+                filename = "no-bg.png"
             content_type = "image/png"
-            filename = "no-bg.png"
             img_format = 'PNG'
         
         elif operation == 'upscale':
@@ -284,9 +684,27 @@ def main(req, res):
             quality = int(fields.get('quality', '85'))
             quality = max(1, min(100, quality))
             
-            if 'estimate' in fields:
+            if 'estimate' in fields and ('qualities' in fields or 'curve' in fields):
+                # Return a size/quality curve for several qualities in one call
+                try:
+                    if 'qualities' in fields:
+                        qualities = [int(q) for q in fields['qualities'].split(',') if q.strip()]
+                    else:
+                        points = max(2, min(100, int(fields['curve'] or '10')))
+                        qualities = [round(1 + i * 99 / (points - 1)) for i in range(points)]
+                    sample = float(fields['sample']) if fields.get('sample') else None
+                except ValueError:
+                    return res.json({"error": "Invalid qualities, curve or sample value"}, 400)
+                
+                qualities = sorted(set(max(1, min(100, q)) for q in qualities))
+                if not qualities:
+                    return res.json({"error": "No qualities requested"}, 400)
+                
+                result = compress_curve(input_image, qualities, len(image_data), sample)
+                return res.json(result)
+            elif 'estimate' in fields:
                 # Return compression estimation as JSON
-                result = compress_image(input_image, quality, estimate=True)
+                result = compress_image(input_image, quality, estimate=True, original_size=len(image_data))
                 return res.json(result)
             else:
                 output_image = compress_image(input_image, quality)
@@ -301,7 +719,40 @@ def main(req, res):
                 if key in fields:
                     settings[key] = fields[key]
             
-            output_image = edit_image(input_image, settings)
+            try:
+                preview_size = int(fields['preview_size']) if fields.get('preview_size') else None
+            except ValueError:
+                return res.json({"error": "Invalid preview_size value"}, 400)
+            if preview_size is not None and preview_size <= 0:
+                return res.json({"error": "preview_size must be positive"}, 400)
+            
+            if use_session and image_data:
+                return res.json({"error": "Send either an image or a session token, not both"}, 400)
+            
+            if session_token == 'new':
+                # Upload once: store the decoded image and return a token for later edits
+                session_token = create_session(input_image)
+                headers["X-Session-Token"] = session_token
+            
+            if session_token:
+                sizes = session_level_sizes(session_token)
+                # Render previews on the pyramid level closest to the requested size
+                level = pyramid_level(sizes, preview_size) if sizes and preview_size else 0
+                source = load_session_level(session_token, level) if sizes else None
+                if source is None:
+                    return res.json({"error": "Session not found or expired"}, 404)
+                
+                if preview_size:
+                    output_image = edit_image(source, settings, scale=source.size[0] / sizes[0][0])
+                    # edit_image can return the cached level itself, so never resize it in place
+                    output_image = output_image.copy()
+                    output_image.thumbnail((preview_size, preview_size))
+                    # Favor encoding speed over size for previews
+                    save_options["compress_level"] = 1
+                else:
+                    output_image = edit_image(source, settings)
+            else:
+                output_image = edit_image(input_image, settings)
             content_type = "image/png"
             filename = "edited.png"
             img_format = 'PNG'
@@ -311,14 +762,15 @@ def main(req, res):
         
         # Convert to bytes
         img_byte_arr = io.BytesIO()
-        output_image.save(img_byte_arr, format=img_format)
+        output_image.save(img_byte_arr, format=img_format, **save_options)
         img_byte_arr.seek(0)
         
         # Return the processed image
-        return res.send(img_byte_arr.getvalue(), 200, {
+        headers.update({
             "Content-Type": content_type,
             "Content-Disposition": f"attachment; filename={filename}"
         })
+        return res.send(img_byte_arr.getvalue(), 200, headers)
         
     except Exception as e:
         print(f"Error: {str(e)}")